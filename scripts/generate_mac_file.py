@@ -11,24 +11,51 @@ Output (C++ header):
   - enum class Vendor : uint8_t
   - static const char* VendorNames[] (display strings aligned to enum order)
   - packed struct MacEntry { uint8_t prefix[3]; Vendor vendor; }
-  - mac_entries_0 .. mac_entries_N arrays (sorted by prefix)
-  - GetVendor(const uint8_t mac[6]) -> Vendor (binary search across chunks)
+  - mac_entries[] (one flat array, sorted by prefix)
+  - mac_index[257] (per-first-byte [start,end) offsets into mac_entries)
+  - GetVendor(const uint8_t mac[6]) -> Vendor (first-byte index + binary search)
   - IsMacRandomized(const uint8_t mac[6]) -> bool (locally administered bit)
   - VendorToString(Vendor) -> const char* (returns VendorNames[...])
 
 Key point:
-  Vendor detection uses *strict* phrase/token rules (word-boundary regex) on a
-  normalized manufacturer string to avoid false positives like:
+  Vendor detection uses *strict* whole-token phrase rules on a normalized
+  manufacturer string to avoid false positives like:
     "Information Technology Limited" -> TI   (wrong)
     "Texas Digital Systems"         -> TI   (wrong)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from binascii import Error as BinasciiError, unhexlify
 from pathlib import Path
-from typing import List, Tuple, Pattern
-import re
+from string import Template
+import csv
+import hashlib
+import mmap
+import os
+import pickle
+from typing import Dict, List, Tuple
+
+try:
+    import hyperscan  # optional: SIMD multi-pattern scan; token-dict fallback below
+except ImportError:
+    hyperscan = None
+
+try:
+    import pandas as pd  # optional: vectorized column parsing; line-loop fallback below
+except ImportError:
+    pd = None
+
+try:
+    # Optional compiled batch classifier (classify.pyx, built on demand);
+    # pure-Python loop fallback below.
+    import pyximport
+    pyximport.install(language_level=3)
+    from classify import classify_batch as _classify_batch
+except ImportError:
+    _classify_batch = None
 
 # ----------------------------
 # Config
@@ -36,7 +63,12 @@ import re
 
 INPUT_FILE = "mac-prefixes"
 OUTPUT_FILE = "src/macprefixes.h"
-CHUNK_SIZE = 250
+
+# "index": flat sorted table + first-byte index, binary-search lookup.
+# "hash":  open-addressing hash table, O(1) lookup. Roughly 4 bytes per
+#          slot at 2x load headroom (~512 KB for the full OUI set), so it
+#          trades a lot of flash for a few comparisons per lookup.
+LOOKUP_MODE = "index"
 
 # Enum order (also used for VendorNames indexing)
 VENDOR_ENUM_ORDER = [
@@ -80,6 +112,15 @@ VENDOR_ENUM_ORDER = [
     "Ugreen",
 ]
 
+# Precomputed per-vendor artifacts: the C++ enum literal emitted for each
+# row, and the enum index entries carry instead of the vendor name.
+VENDOR_LIT = [f"Vendor::{n}" for n in VENDOR_ENUM_ORDER]
+VENDOR_IDX = {n: i for i, n in enumerate(VENDOR_ENUM_ORDER)}
+
+# byte -> "XX" table: row emission indexes this instead of running three
+# %02X conversions per entry (~150k printf-style formats for the full set).
+HEX = [format(i, "02X") for i in range(256)]
+
 # Display strings aligned 1:1 with VENDOR_ENUM_ORDER above.
 # If you add/remove enum entries, update this mapping accordingly.
 VENDOR_DISPLAY_NAMES = {
@@ -124,121 +165,305 @@ VENDOR_DISPLAY_NAMES = {
 }
 
 # Normalize manufacturer names to: UPPERCASE words/digits separated by single spaces
-_NON_ALNUM = re.compile(r"[^0-9A-Z]+")
-_PREFIX_HEX = re.compile(r"^[0-9A-F]{6}$")
+class _NormTable(dict):
+    # str.translate table: identity for A-Z/0-9, space for any other
+    # codepoint (same effect as the old [^0-9A-Z] regex sub, but one
+    # C-level pass with no regex engine involved).
+    def __missing__(self, codepoint: int) -> str:
+        return " "
 
-def normalize_manufacturer(s: str) -> str:
-    s = s.upper()
-    s = _NON_ALNUM.sub(" ", s).strip()
-    s = " ".join(s.split())
-    return s
+_NORM_TABLE = _NormTable({ord(c): c for c in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
 
-def rx(pattern: str) -> Pattern[str]:
-    # Patterns are applied to the normalized string, so hyphens/punctuation already removed.
-    return re.compile(pattern)
+# Separator chars stripped from MAC prefixes before hex parsing
+_STRIP_SEP = b":-. "
+
+@lru_cache(maxsize=None)
+def normalize_manufacturer(s: str) -> str:
+    s = s.upper().translate(_NORM_TABLE)
+    return " ".join(s.split())
 
 # Strict matching rules:
-# - Use \bWORD\b for token matches
-# - Use explicit phrases for tricky vendors (TI, CSR)
+# - Phrases are matched against whole tokens of the normalized string
+# - Use explicit multi-word phrases for tricky vendors (TI, CSR)
 #
-# IMPORTANT: Avoid short ambiguous tokens like "\bTI\b" entirely.
-VENDOR_PATTERNS: List[Tuple[str, List[Pattern[str]]]] = [
+# IMPORTANT: Avoid short ambiguous tokens like "TI" entirely.
+VENDOR_PHRASES: List[Tuple[str, List[str]]] = [
     # Most specific / phrase-based first
-    ("Apple",   [rx(r"\bAPPLE\b")]),
-    ("Asus",    [rx(r"\bASUSTEK\b"), rx(r"\bASUS\b")]),
-    ("Broadcom",[rx(r"\bBROADCOM\b")]),
-    ("Chipolo", [rx(r"\bCHIPOLO\b")]),
-    ("Cisco",   [rx(r"\bCISCO\b")]),
-    ("Csr",     [rx(r"\bCAMBRIDGE SILICON RADIO\b")]),
-    ("DLink",   [rx(r"\bD LINK\b")]),
-    ("Espressif",[rx(r"\bESPRESSIF\b")]),
-    ("EssilorLuxottica",[rx(r"\bESSILORLUXOTTICA\b")]),
-    ("Eufy",    [rx(r"\bEUFY\b")]),
-    ("Flock",    [rx(r"\bFLOCK\b")]),
-    ("Google",  [rx(r"\bGOOGLE\b")]),
-    ("Huawei",  [rx(r"\bHUAWEI\b")]),
-    ("Innway",  [rx(r"\bINNWAY\b")]),
-    ("Intel",   [rx(r"\bINTEL\b")]),
-    ("Intelbras",[rx(r"\bINTELBRAS\b")]),
-    ("Jio",[rx(r"\bJIO\b")]),
-    ("Mercury", [rx(r"\bMERCURY\b")]),
-    ("Mercusys",[rx(r"\bMERCUSYS\b")]),
-    ("Meta",[rx(r"\bMETA\b"), rx(r"\bFACEBOOK\b")]),
-    ("Microsoft",[rx(r"\bMICROSOFT\b")]),
-    ("Mikrotik",[rx(r"\bMIKROTIK\b"), rx(r"\bROUTERBOARD\b")]),
-    ("Motorola",[rx(r"\bMOTOROLA\b")]),
-    ("Netgear", [rx(r"\bNETGEAR\b")]),
-    ("Pebblebee", [rx(r"\bPEBBLEBEE\b")]),
-    ("RaspberryPi", [rx(r"\bRASPBERRY PI\b")]),
-    ("RollingSquare", [rx(r"\bROLLING SQUARE\b")]),
-    ("Samsung", [rx(r"\bSAMSUNG\b")]),
-    ("Snapchat", [rx(r"\bSNAPCHAT\b")]),
-    ("Sony",    [rx(r"\bSONY\b")]),
-    ("Ti",      [rx(r"\bTEXAS INSTRUMENTS\b")]),  # do NOT match plain "TEXAS" or "TI"
-    ("Tile",    [rx(r"\bTILE\b")]),
-    ("TpLink",  [rx(r"\bTP LINK\b")]),
-    ("Tracki",  [rx(r"\bTRACKI\b")]),
-    ("Ubiquiti",[rx(r"\bUBIQUITI\b")]),
-    ("Ugreen",[rx(r"\bUGREEN\b")]),
+    ("Apple",   ["APPLE"]),
+    ("Asus",    ["ASUSTEK", "ASUS"]),
+    ("Broadcom",["BROADCOM"]),
+    ("Chipolo", ["CHIPOLO"]),
+    ("Cisco",   ["CISCO"]),
+    ("Csr",     ["CAMBRIDGE SILICON RADIO"]),
+    ("DLink",   ["D LINK"]),
+    ("Espressif",["ESPRESSIF"]),
+    ("EssilorLuxottica",["ESSILORLUXOTTICA"]),
+    ("Eufy",    ["EUFY"]),
+    ("Flock",    ["FLOCK"]),
+    ("Google",  ["GOOGLE"]),
+    ("Huawei",  ["HUAWEI"]),
+    ("Innway",  ["INNWAY"]),
+    ("Intel",   ["INTEL"]),
+    ("Intelbras",["INTELBRAS"]),
+    ("Jio",["JIO"]),
+    ("Mercury", ["MERCURY"]),
+    ("Mercusys",["MERCUSYS"]),
+    ("Meta",["META", "FACEBOOK"]),
+    ("Microsoft",["MICROSOFT"]),
+    ("Mikrotik",["MIKROTIK", "ROUTERBOARD"]),
+    ("Motorola",["MOTOROLA"]),
+    ("Netgear", ["NETGEAR"]),
+    ("Pebblebee", ["PEBBLEBEE"]),
+    ("RaspberryPi", ["RASPBERRY PI"]),
+    ("RollingSquare", ["ROLLING SQUARE"]),
+    ("Samsung", ["SAMSUNG"]),
+    ("Snapchat", ["SNAPCHAT"]),
+    ("Sony",    ["SONY"]),
+    ("Ti",      ["TEXAS INSTRUMENTS"]),  # do NOT match plain "TEXAS" or "TI"
+    ("Tile",    ["TILE"]),
+    ("TpLink",  ["TP LINK"]),
+    ("Tracki",  ["TRACKI"]),
+    ("Ubiquiti",["UBIQUITI"]),
+    ("Ugreen",["UGREEN"]),
 ]
 
+# Phrase tables keyed by token n-grams. The normalized string is split into
+# tokens once per line and matching is a handful of dict lookups -- no regex
+# engine involved. Values are (priority, vendor); lower priority wins, so
+# rule order above is preserved.
+_SINGLE: Dict[str, Tuple[int, str]] = {}
+_BIGRAM: Dict[Tuple[str, str], Tuple[int, str]] = {}
+_TRIGRAM: Dict[Tuple[str, str, str], Tuple[int, str]] = {}
+
+for _priority, (_vendor, _phrases) in enumerate(VENDOR_PHRASES):
+    for _phrase in _phrases:
+        _toks = tuple(_phrase.split())
+        _hit = (_priority, _vendor)
+        if len(_toks) == 1:
+            _SINGLE.setdefault(_toks[0], _hit)
+        elif len(_toks) == 2:
+            _BIGRAM.setdefault(_toks, _hit)
+        elif len(_toks) == 3:
+            _TRIGRAM.setdefault(_toks, _hit)
+        else:
+            raise ValueError(f"Phrase too long (max 3 tokens): {_phrase!r}")
+
+def _build_hs_db():
+    # Compile every vendor phrase (rebuilt as \b-anchored patterns from
+    # VENDOR_PHRASES) into one Hyperscan DFA. Pattern ids carry the rule
+    # priority so the scan callback can keep the best hit.
+    if hyperscan is None:
+        return None
+    expressions = []
+    ids = []
+    for priority, (vendor, phrases) in enumerate(VENDOR_PHRASES):
+        for phrase in phrases:
+            expressions.append(rf"\b{phrase}\b".encode("ascii"))
+            ids.append(priority)
+    db = hyperscan.Database()
+    db.compile(expressions=expressions, ids=ids, elements=len(expressions))
+    return db
+
+_HS_DB = _build_hs_db()
+
+# The OUI database repeats the same manufacturer string across many
+# prefixes, so memoizing classifies each unique string only once.
+@lru_cache(maxsize=None)
 def vendor_from_manufacturer(manufacturer: str) -> str:
-    m = normalize_manufacturer(manufacturer)
-    for vendor, patterns in VENDOR_PATTERNS:
-        for p in patterns:
-            if p.search(m):
-                return vendor
-    return "Unknown"
+    norm = normalize_manufacturer(manufacturer)
+    if _HS_DB is not None:
+        best = len(VENDOR_PHRASES)
+
+        def on_match(pat_id: int, start: int, end: int, flags: int, ctx=None):
+            nonlocal best
+            if pat_id < best:
+                best = pat_id
+
+        # norm is pure [0-9A-Z ] after normalization, so ascii is safe.
+        _HS_DB.scan(norm.encode("ascii"), match_event_handler=on_match)
+        return VENDOR_PHRASES[best][0] if best < len(VENDOR_PHRASES) else "Unknown"
+
+    toks = norm.split()
+    n = len(toks)
+    hits = []
+    for i in range(n - 2):
+        hit = _TRIGRAM.get((toks[i], toks[i + 1], toks[i + 2]))
+        if hit is not None:
+            hits.append(hit)
+    for i in range(n - 1):
+        hit = _BIGRAM.get((toks[i], toks[i + 1]))
+        if hit is not None:
+            hits.append(hit)
+    for tok in toks:
+        hit = _SINGLE.get(tok)
+        if hit is not None:
+            hits.append(hit)
+    return min(hits)[1] if hits else "Unknown"
+
+def parse_prefix_bytes(prefix: bytes) -> Tuple[int, int, int]:
+    # translate is a single C pass and unhexlify validates the hex digits
+    # for us -- much cheaper than regex + chained replace calls, and it
+    # works on raw bytes with no decode step.
+    p = prefix.translate(None, _STRIP_SEP)
+    try:
+        b = unhexlify(p)
+    except BinasciiError:
+        b = b""
+    if len(b) != 3:
+        raise ValueError(f"Invalid prefix {prefix!r} -> {p!r} (need 6 hex chars)")
+    return b[0], b[1], b[2]
 
 def parse_prefix_to_bytes(prefix: str) -> Tuple[int, int, int]:
-    p = prefix.strip().upper()
-    p = p.replace(":", "").replace("-", "").replace(" ", "")
-    if not _PREFIX_HEX.match(p):
-        raise ValueError(f"Invalid prefix '{prefix}' -> '{p}' (need 6 hex chars)")
-    return int(p[0:2], 16), int(p[2:4], 16), int(p[4:6], 16)
-
-@dataclass(frozen=True)
-class Entry:
-    b0: int
-    b1: int
-    b2: int
-    vendor: str
+    return parse_prefix_bytes(prefix.encode("ascii", "replace"))
+
+# Each entry is one int packed as (b0<<24)|(b1<<16)|(b2<<8)|vendor_idx.
+# Sorting a list of small ints is a single machine-word compare per step,
+# and packing keeps ~50k entries in one compact list with no per-entry
+# container at all. The emit side unpacks with shifts.
+Entry = int
+
+# Classification is embarrassingly parallel across lines; below this many
+# manufacturers the worker startup + IPC cost outweighs the win.
+_POOL_MIN_LINES = 10_000
+
+def _classify_manufacturers(manufacturers: List[str]) -> List[int]:
+    if _classify_batch is not None:
+        norms = [normalize_manufacturer(m) for m in manufacturers]
+        sentinel = len(VENDOR_PHRASES)
+        priority_to_idx = [VENDOR_IDX[v] for v, _ in VENDOR_PHRASES]
+        unknown = VENDOR_IDX["Unknown"]
+        return [
+            priority_to_idx[p] if p < sentinel else unknown
+            for p in _classify_batch(norms, _SINGLE, _BIGRAM, _TRIGRAM, sentinel)
+        ]
+    if len(manufacturers) >= _POOL_MIN_LINES:
+        with ProcessPoolExecutor() as ex:
+            # Large chunksize amortizes pickling across many lines.
+            vendors = list(ex.map(vendor_from_manufacturer, manufacturers, chunksize=1024))
+        return [VENDOR_IDX[v] for v in vendors]
+    return [VENDOR_IDX[vendor_from_manufacturer(m)] for m in manufacturers]
+
+def _read_pairs(file_path: str) -> Tuple[List[Tuple[int, int, int]], List[str]]:
+    prefixes: List[Tuple[int, int, int]] = []
+    manufacturers: List[str] = []
+
+    with open(file_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return prefixes, manufacturers
+        # mmap + bytes parsing: line splitting, comment/blank filtering and
+        # prefix hex parsing all stay at the bytes level, so the file is
+        # never copied or decoded as a whole. Only the manufacturer field
+        # is decoded (latin-1: a straight byte widening, no validation
+        # pass) because the classifier cache and its optional accelerators
+        # key on str.
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = size
+                line = mm[pos:nl].strip()
+                pos = nl + 1
+
+                if not line or line.startswith(b"#"):
+                    continue
+
+                parts = line.split(None, 1)
+                if len(parts) < 2:
+                    continue
+
+                try:
+                    b0, b1, b2 = parse_prefix_bytes(parts[0])
+                except ValueError:
+                    continue
+
+                prefixes.append((b0, b1, b2))
+                manufacturers.append(parts[1].decode("latin-1"))
+
+    return prefixes, manufacturers
+
+def _read_pairs_pandas(file_path: str) -> Tuple[List[Tuple[int, int, int]], List[str]]:
+    # Column-wise splitting runs as C kernels over the whole file instead
+    # of a Python loop per line. latin-1 and the startswith("#") filter
+    # keep this path byte-for-byte consistent with _read_pairs: latin-1
+    # accepts any input byte, only whole comment lines are dropped (a "#"
+    # mid-line is manufacturer text, not a comment), QUOTE_NONE stops a
+    # stray double quote from swallowing the following lines, and
+    # na_filter=False keeps NA-lookalike text ("NaN", "NULL", ...) as the
+    # literal strings the fallback sees.
+    prefixes: List[Tuple[int, int, int]] = []
+    manufacturers: List[str] = []
+
+    try:
+        df = pd.read_csv(
+            file_path, sep="\x01", header=None, names=["line"],
+            engine="c", skip_blank_lines=True, dtype=str, encoding="latin-1",
+            quoting=csv.QUOTE_NONE, na_filter=False,
+        )
+    except pd.errors.EmptyDataError:
+        return prefixes, manufacturers
+    except pd.errors.ParserError:
+        # A literal \x01 byte in the input collides with the sentinel sep;
+        # parse that file with the plain loop instead of guessing.
+        return _read_pairs(file_path)
+
+    lines = df["line"].str.strip()
+    lines = lines[(lines != "") & ~lines.str.startswith("#")]
+    parts = lines.str.split(n=1, expand=True)
+    if parts.shape[1] < 2:
+        # No line had both a prefix and a manufacturer field.
+        return prefixes, manufacturers
+    parts = parts.dropna()
+
+    for prefix_str, manufacturer in zip(parts[0].tolist(), parts[1].tolist()):
+        try:
+            prefixes.append(parse_prefix_to_bytes(prefix_str))
+        except ValueError:
+            continue
+        manufacturers.append(manufacturer)
+    return prefixes, manufacturers
 
 def read_mac_file(file_path: str) -> List[Entry]:
-    entries: List[Entry] = []
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            parts = line.split(maxsplit=1)
-            if len(parts) < 2:
-                continue
-
-            prefix_str, manufacturer = parts[0], parts[1]
-
-            try:
-                b0, b1, b2 = parse_prefix_to_bytes(prefix_str)
-            except ValueError:
-                continue
-
-            vendor = vendor_from_manufacturer(manufacturer)
-            if vendor == "Unknown":
-                continue
-
-            entries.append(Entry(b0, b1, b2, vendor))
-
-    entries.sort(key=lambda e: (e.b0, e.b1, e.b2, e.vendor))
+    if pd is not None:
+        prefixes, manufacturers = _read_pairs_pandas(file_path)
+    else:
+        prefixes, manufacturers = _read_pairs(file_path)
+
+    unknown = VENDOR_IDX["Unknown"]
+    entries = [
+        (b0 << 24) | (b1 << 16) | (b2 << 8) | vi
+        for (b0, b1, b2), vi in zip(prefixes, _classify_manufacturers(manufacturers))
+        if vi != unknown
+    ]
+    entries.sort()
     return entries
 
-def chunk_entries(entries: List[Entry], chunk_size: int) -> List[List[Entry]]:
-    return [entries[i : i + chunk_size] for i in range(0, len(entries), chunk_size)]
+def build_first_byte_index(entries: List[Entry]) -> List[int]:
+    """Prefix sums of entry counts per first prefix byte (len 257).
+
+    Slot b covers entries[index[b]:index[b + 1]], so the generated lookup
+    narrows to one first-byte bucket with a single load before searching.
+    """
+    counts = [0] * 256
+    for e in entries:
+        counts[e >> 24] += 1
+    index = [0] * 257
+    for i, c in enumerate(counts):
+        index[i + 1] = index[i] + c
+    return index
 
 # ----------------------------
 # C++ generation
 # ----------------------------
 
+# Bound %-formatter for one MacEntry row (newline included so rows can
+# be streamed with writelines). Applied with map() over entry tuples:
+# %-formatting a tuple is measurably faster than an f-string per entry,
+# and map keeps the loop in C. The vendor literal is looked up in
+# VENDOR_LIT rather than re-interpolated ~50k times.
+_ROW = "    { {0x%s, 0x%s, 0x%s}, %s },\n".__mod__
+
 def cpp_enum_vendor() -> str:
     lines = []
     lines.append("enum class Vendor : std::uint8_t {")
@@ -271,102 +496,221 @@ def cpp_vendor_to_string() -> str:
         "}",
     ])
 
-def cpp_header(entries: List[Entry]) -> str:
-    chunks = chunk_entries(entries, CHUNK_SIZE)
-
-    out: List[str] = []
-    out.append("#pragma once")
-    out.append("")
-    out.append("#include <cstdint>")
-    out.append("#include <cstddef>")
-    out.append("")
-    out.append("// Auto-generated. Do not edit by hand.")
-    out.append(f"// Source: {INPUT_FILE}")
-    out.append("")
-
-    out.append(cpp_enum_vendor())
-    out.append("")
-    out.append(cpp_vendor_names_array())
-    out.append("")
-
-    out.append("struct MacEntry {")
-    out.append("    std::uint8_t prefix[3];")
-    out.append("    Vendor vendor;")
-    out.append("} __attribute__((packed));")
-    out.append("")
-
-    for ci, chunk in enumerate(chunks):
-        out.append(f"static const MacEntry mac_entries_{ci}[] = {{")
-        for e in chunk:
-            out.append(
-                f"    {{ {{0x{e.b0:02X}, 0x{e.b1:02X}, 0x{e.b2:02X}}}, Vendor::{e.vendor} }},"
-            )
-        out.append("};")
-        out.append("")
-
-    out.append("static const MacEntry* const mac_arrays[] = {")
-    for ci in range(len(chunks)):
-        out.append(f"    mac_entries_{ci},")
-    out.append("};")
-    out.append("")
-    out.append("static const std::size_t mac_array_sizes[] = {")
-    for chunk in chunks:
-        out.append(f"    {len(chunk)},")
-    out.append("};")
-    out.append("")
-
-    out.append("static inline int ComparePrefix3(const std::uint8_t a[3], const std::uint8_t b[3])")
-    out.append("{")
-    out.append("    if (a[0] != b[0]) return (int)a[0] - (int)b[0];")
-    out.append("    if (a[1] != b[1]) return (int)a[1] - (int)b[1];")
-    out.append("    if (a[2] != b[2]) return (int)a[2] - (int)b[2];")
-    out.append("    return 0;")
-    out.append("}")
-    out.append("")
-
-    out.append("static inline Vendor GetVendor(const std::uint8_t macAddress[6])")
-    out.append("{")
-    out.append("    const std::uint8_t key[3] = { macAddress[0], macAddress[1], macAddress[2] };")
-    out.append("    const std::size_t numArrays = sizeof(mac_arrays) / sizeof(mac_arrays[0]);")
-    out.append("    for (std::size_t ai = 0; ai < numArrays; ++ai) {")
-    out.append("        const MacEntry* entries = mac_arrays[ai];")
-    out.append("        const int size = (int)mac_array_sizes[ai];")
-    out.append("        int low = 0;")
-    out.append("        int high = size - 1;")
-    out.append("        while (low <= high) {")
-    out.append("            int mid = (low + high) >> 1;")
-    out.append("            int cmp = ComparePrefix3(key, entries[mid].prefix);")
-    out.append("            if (cmp == 0) return entries[mid].vendor;")
-    out.append("            if (cmp > 0) low = mid + 1; else high = mid - 1;")
-    out.append("        }")
-    out.append("    }")
-    out.append("    return Vendor::Unknown;")
-    out.append("}")
-    out.append("")
-
-    out.append("static inline bool IsMacRandomized(const std::uint8_t macAddress[6])")
-    out.append("{")
-    out.append("    // Locally administered (U/L) bit set => very likely randomized/spoofed.")
-    out.append("    return (macAddress[0] & 0x02u) != 0;")
-    out.append("}")
-    out.append("")
-
-    out.append(cpp_vendor_to_string())
-    out.append("")
-    out.append(f"// Entries: {len(entries)} in {len(chunks)} chunk(s)")
-    return "\n".join(out)
+_HASH_EMPTY = 0xFFFFFFFF
+_HASH_MULT = 0x9E3779B1  # 2^32 / golden ratio
+
+def build_hash_table(entries: List[Entry]) -> Tuple[List[int], int]:
+    """Linear-probe hash table of packed entries, sized to the next power
+    of two >= 2x the entry count. Returns (table, shift) where slot =
+    (key24 * _HASH_MULT) >> shift and probing wraps with the size mask.
+    """
+    size = 1024
+    while size < 2 * len(entries):
+        size *= 2
+    shift = 32 - (size.bit_length() - 1)
+    mask = size - 1
+    table = [_HASH_EMPTY] * size
+    for e in entries:
+        h = (((e >> 8) * _HASH_MULT) & 0xFFFFFFFF) >> shift
+        while table[h] != _HASH_EMPTY:
+            h = (h + 1) & mask
+        table[h] = e
+    return table, shift
+
+# Static header sections as Templates, compiled once at module load.
+# Each section becomes a single substitute + write instead of dozens of
+# per-line Python calls; the variable-length entry rows are still
+# streamed between the blocks with writelines.
+_PROLOGUE_TPL = Template("""\
+#pragma once
+
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+
+// Auto-generated. Do not edit by hand.
+// Source: ${input_file}
+
+${vendor_enum}
+
+${vendor_names}
+
+""")
+
+_INDEX_ENTRIES_OPEN = """\
+struct MacEntry {
+    std::uint8_t prefix[3];
+    Vendor vendor;
+} __attribute__((packed));
+
+static const MacEntry mac_entries[] = {
+"""
+
+_INDEX_LOOKUP_TPL = Template("""\
+};
+
+// [start,end) offsets into mac_entries per first prefix byte.
+static const ${index_type} mac_index[257] = {
+${index_rows}
+};
+
+static inline int ComparePrefix3(const std::uint8_t a[3], const std::uint8_t b[3])
+{
+    // Load each prefix as one little-endian word and byte-swap it into
+    // a big-endian 24-bit key: a single subtract replaces three
+    // compare-and-branch steps in the binary search's hot loop.
+    std::uint32_t x = 0, y = 0;
+    std::memcpy(&x, a, 3);
+    std::memcpy(&y, b, 3);
+    x = __builtin_bswap32(x << 8);
+    y = __builtin_bswap32(y << 8);
+    return (int)x - (int)y;
+}
+
+static inline Vendor GetVendor(const std::uint8_t macAddress[6])
+{
+    const std::uint8_t key[3] = { macAddress[0], macAddress[1], macAddress[2] };
+    int low = (int)mac_index[macAddress[0]];
+    int high = (int)mac_index[macAddress[0] + 1] - 1;
+    while (low <= high) {
+        int mid = (low + high) >> 1;
+        int cmp = ComparePrefix3(key, mac_entries[mid].prefix);
+        if (cmp == 0) return mac_entries[mid].vendor;
+        if (cmp > 0) low = mid + 1; else high = mid - 1;
+    }
+    return Vendor::Unknown;
+}
+
+""")
+
+_HASH_ENTRIES_OPEN_TPL = Template("""\
+// Open-addressing hash table of (prefix24 << 8) | vendor slots;
+// ${empty} marks an empty slot.
+static const std::uint32_t mac_hash[${size}] = {
+""")
+
+_HASH_LOOKUP_TPL = Template("""\
+};
+
+static inline Vendor GetVendor(const std::uint8_t macAddress[6])
+{
+    const std::uint32_t key = ((std::uint32_t)macAddress[0] << 16) |
+                              ((std::uint32_t)macAddress[1] << 8) |
+                              macAddress[2];
+    std::uint32_t h = (key * ${mult}u) >> ${shift};
+    while (mac_hash[h] != ${empty}u) {
+        if ((mac_hash[h] >> 8) == key)
+            return (Vendor)(mac_hash[h] & 0xFFu);
+        h = (h + 1u) & ${mask}u;
+    }
+    return Vendor::Unknown;
+}
+
+""")
+
+_EPILOGUE_TPL = Template("""\
+static inline bool IsMacRandomized(const std::uint8_t macAddress[6])
+{
+    // Locally administered (U/L) bit set => very likely randomized/spoofed.
+    return (macAddress[0] & 0x02u) != 0;
+}
+
+${vendor_to_string}
+
+// Entries: ${count}
+""")
+
+def write_cpp_header(entries: List[Entry], f) -> None:
+    # Streams straight to the file handle instead of materializing the
+    # whole header (several MB for the full OUI set) as one string.
+    f.write(_PROLOGUE_TPL.substitute(
+        input_file=INPUT_FILE,
+        vendor_enum=cpp_enum_vendor(),
+        vendor_names=cpp_vendor_names_array(),
+    ))
+
+    if LOOKUP_MODE == "hash":
+        _write_hash_lookup(entries, f)
+    else:
+        _write_index_lookup(entries, f)
+
+    f.write(_EPILOGUE_TPL.substitute(
+        vendor_to_string=cpp_vendor_to_string(),
+        count=len(entries),
+    ))
+
+def _write_index_lookup(entries: List[Entry], f) -> None:
+    index = build_first_byte_index(entries)
+
+    f.write(_INDEX_ENTRIES_OPEN)
+    f.writelines(map(_ROW, (
+        (HEX[e >> 24], HEX[(e >> 16) & 0xFF], HEX[(e >> 8) & 0xFF], VENDOR_LIT[e & 0xFF])
+        for e in entries
+    )))
+    f.write(_INDEX_LOOKUP_TPL.substitute(
+        # uint16 offsets cover the current database; fall back to uint32
+        # if it ever outgrows 65535 entries.
+        index_type="std::uint16_t" if len(entries) <= 0xFFFF else "std::uint32_t",
+        index_rows="\n".join(
+            "    " + " ".join(f"{v}," for v in index[i : i + 16])
+            for i in range(0, 257, 16)
+        ),
+    ))
+
+def _write_hash_lookup(entries: List[Entry], f) -> None:
+    table, shift = build_hash_table(entries)
+    size = len(table)
+
+    f.write(_HASH_ENTRIES_OPEN_TPL.substitute(empty=f"0x{_HASH_EMPTY:08X}", size=size))
+    f.writelines(
+        "    " + " ".join(f"0x{v:08X}," for v in table[i : i + 8]) + "\n"
+        for i in range(0, size, 8)
+    )
+    f.write(_HASH_LOOKUP_TPL.substitute(
+        mult=f"0x{_HASH_MULT:08X}",
+        shift=shift,
+        empty=f"0x{_HASH_EMPTY:08X}",
+        mask=f"0x{size - 1:X}",
+    ))
+
+# Cached entries bake in VENDOR_PHRASES priorities and VENDOR_IDX enum
+# indices, so editing the vendor rules or the enum order must invalidate
+# the cache just like a changed input file does.
+_RULES_DIGEST = hashlib.sha256(
+    repr((VENDOR_ENUM_ORDER, VENDOR_PHRASES)).encode()
+).hexdigest()
+
+def load_entries(file_path: str) -> List[Entry]:
+    # Rebuilds during development re-run the generator far more often than
+    # the OUI file changes; cache the parsed entries keyed on the source
+    # mtime and the vendor-rule digest so warm runs skip all parsing and
+    # classification. Protocol-5 pickling of a list of ints is near
+    # memcpy speed.
+    src_mtime = os.stat(file_path).st_mtime
+    cache_path = Path(file_path + ".cache.pkl")
+    if cache_path.exists():
+        try:
+            mtime, digest, entries = pickle.loads(cache_path.read_bytes())
+            if mtime == src_mtime and digest == _RULES_DIGEST:
+                return entries
+        except (pickle.PickleError, EOFError, ValueError):
+            pass  # stale or corrupt cache: fall through and rebuild
+    entries = read_mac_file(file_path)
+    cache_path.write_bytes(pickle.dumps((src_mtime, _RULES_DIGEST, entries), protocol=5))
+    return entries
 
 def main() -> int:
-    entries = read_mac_file(INPUT_FILE)
+    entries = load_entries(INPUT_FILE)
 
     out_path = Path(OUTPUT_FILE)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    out_path.write_text(cpp_header(entries) + "\n", encoding="utf-8", newline="\n")
+    # 1 MiB buffer keeps the syscall count low while streaming.
+    with out_path.open("w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+        write_cpp_header(entries, f)
 
     print(f"Generated: {OUTPUT_FILE}")
     print(f"Entries:   {len(entries)}")
-    print(f"Chunks:    {(len(entries) + CHUNK_SIZE - 1) // CHUNK_SIZE} (chunk size {CHUNK_SIZE})")
     return 0
 
 if __name__ == "__main__":